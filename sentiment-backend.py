@@ -1,13 +1,34 @@
 import os
 import re
+import time
+import asyncio
+import hashlib
+import queue
 import logging
+import logging.handlers
+import threading
+import aiohttp
+import faiss
+import httpx
+import numpy as np
+import orjson
 import requests
-from dataclasses import dataclass
-from typing import List, Dict, Any
-from newspaper import Article
+import trafilatura
+import redis.asyncio as redis
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from datasketch import MinHash, MinHashLSH
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from sentence_transformers import SentenceTransformer
 from google import genai
+from google.genai import types
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # ------------------- Configuration -------------------
@@ -16,6 +37,7 @@ load_dotenv()  # Load from .env file
 
 BRAVE_API_KEY = os.getenv("BRAVE_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
 if not BRAVE_API_KEY:
     raise ValueError("Missing BRAVE_API_KEY environment variable!")
@@ -23,9 +45,41 @@ if not BRAVE_API_KEY:
 if not GEMINI_API_KEY:
     raise ValueError("Missing GEMINI_API_KEY environment variable!")
 
-logging.basicConfig(level=logging.INFO)
+# Log records are handed to a background listener thread so the event loop never blocks on stderr
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+log_listener.start()
 
-client = genai.Client(api_key=GEMINI_API_KEY)
+logger = logging.getLogger(__name__)
+
+# One pooled HTTP/2 client so concurrent Gemini calls share TLS sessions and multiplex
+# (http2 and limits are set on the transport, since httpx ignores them on the client when one is passed)
+gemini_http_client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+)
+
+client = genai.Client(
+    api_key=GEMINI_API_KEY,
+    http_options=types.HttpOptions(timeout=30_000, httpx_async_client=gemini_http_client)
+)
+
+# Redis is optional: short timeouts make an unreachable instance behave like a cache miss
+REDIS_TIMEOUT_SECONDS = 0.5
+redis_client = redis.from_url(
+    REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+    socket_timeout=REDIS_TIMEOUT_SECONDS
+)
+
+# Cap concurrent Gemini calls to stay within the API rate limits
+# (the semaphore itself is created in lifespan so it binds to the serving event loop)
+MAX_CONCURRENT_GEMINI_CALLS = 10
 
 # ------------------- Data Classes -------------------
 
@@ -38,13 +92,33 @@ class SentimentResult:
     insights: List[str]
     url: str
 
+class SentimentResultSchema(BaseModel):
+    id: int
+    summary: str
+    sentiment: str
+    confidence: int
+    insights: List[str]
+
 class TopicRequest(BaseModel):
     topic: str = "Finance"
     num_articles: int = 5
 
 # ------------------- Brave Search -------------------
 
-def get_news_articles(topic="Finance", num_articles=5):
+# Shared session so repeat Brave calls reuse pooled TCP + TLS connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# Brave results change on the minute scale, so repeat topics are served from memory
+NEWS_CACHE_TTL_SECONDS = 60
+news_cache = TTLCache(maxsize=256, ttl=NEWS_CACHE_TTL_SECONDS)
+news_cache_lock = threading.Lock()
+
+def _fetch_news_articles(topic, num_articles):
     headers = {
         "Accept": "application/json",
         "X-Subscription-Token": BRAVE_API_KEY
@@ -57,37 +131,244 @@ def get_news_articles(topic="Finance", num_articles=5):
         "search_lang": "en"
     }
 
-    response = requests.get(
+    response = SESSION.get(
         "https://api.search.brave.com/res/v1/news/search",
         headers=headers,
-        params=params
+        params=params,
+        timeout=10
     )
     response.raise_for_status()
     return response.json().get("results", [])
 
-def get_article_content(url, fallback_title=""):
+def get_news_articles(topic="Finance", num_articles=5):
+    key = (topic.lower().strip(), num_articles)
+    with news_cache_lock:
+        cached = news_cache.get(key)
+    if cached is not None:
+        return cached
+
+    articles = _fetch_news_articles(topic, num_articles)
+    with news_cache_lock:
+        news_cache[key] = articles
+    return articles
+
+# Only the first few thousand chars of text are used, so huge pages are cut off early
+MAX_ARTICLE_BYTES = 512_000
+MIN_PARAGRAPH_TAGS = 3
+_ARTICLE_TAG_RE = re.compile(rb"<article[\s>]", re.IGNORECASE)
+_PARAGRAPH_TAG_RE = re.compile(rb"<p[\s>]", re.IGNORECASE)
+
+ARTICLE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+async def get_cached_article(url) -> Dict[str, str]:
+    try:
+        return await redis_client.hgetall(f"art:{url}")
+    except redis.RedisError as e:
+        logger.warning("Could not read article cache: %s", e)
+        return {}
+
+async def set_cached_article(url, etag, last_modified, text):
+    key = f"art:{url}"
     try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        return article.text or fallback_title
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"etag": etag, "lm": last_modified, "text": text})
+            pipe.expire(key, ARTICLE_CACHE_TTL_SECONDS)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Could not write article cache: %s", e)
+
+def _looks_like_article(html: bytes) -> bool:
+    if _ARTICLE_TAG_RE.search(html):
+        return True
+    return len(_PARAGRAPH_TAG_RE.findall(html)) >= MIN_PARAGRAPH_TAGS
+
+async def get_article_content(session, url, fallback_title=""):
+    try:
+        # Revalidate previously extracted articles so unchanged pages come back as a bodiless 304
+        cached = await get_cached_article(url)
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("lm"):
+            headers["If-Modified-Since"] = cached["lm"]
+
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status == 304 and cached.get("text"):
+                return cached["text"]
+            response.raise_for_status()
+            etag = response.headers.get("ETag", "")
+            last_modified = response.headers.get("Last-Modified", "")
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total > MAX_ARTICLE_BYTES:
+                    break
+            raw_html = b"".join(chunks)
+
+        if not _looks_like_article(raw_html):
+            return fallback_title
+
+        # Raw bytes let trafilatura detect the encoding, including <meta charset> declarations
+        text = await asyncio.to_thread(
+            trafilatura.extract,
+            raw_html,
+            include_comments=False,
+            include_tables=False,
+            fast=True
+        )
+        if not text:
+            return fallback_title
+
+        if etag or last_modified:
+            await set_cached_article(url, etag, last_modified, text)
+        return text
     except Exception as e:
-        logging.warning(f"Could not parse article content from {url}: {e}")
+        logger.warning("Could not parse article content from %s: %s", url, e)
         return fallback_title
 
+# ------------------- Deduplication -------------------
+
+MINHASH_NUM_PERM = 128
+DUPLICATE_THRESHOLD = 0.85
+SHINGLE_WORDS = 3
+
+def canonicalize_url(url):
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        ""
+    ))
+
+def _minhash(text):
+    words = text.lower().split()
+    minhash = MinHash(num_perm=MINHASH_NUM_PERM)
+    for i in range(max(len(words) - SHINGLE_WORDS + 1, 1)):
+        minhash.update(" ".join(words[i:i + SHINGLE_WORDS]).encode("utf-8"))
+    return minhash
+
+def cluster_articles(items: List[Dict[str, str]]) -> List[List[int]]:
+    """Group indices of items that share a canonical URL or are near-duplicate stories."""
+    lsh = MinHashLSH(threshold=DUPLICATE_THRESHOLD, num_perm=MINHASH_NUM_PERM)
+    clusters = []
+    representatives = []  # MinHash of each cluster's first article, aligned with clusters
+    cluster_by_url = {}
+
+    for i, item in enumerate(items):
+        # Articles without a URL have nothing to share, so they skip the URL shortcut
+        canonical = canonicalize_url(item["url"])
+        if canonical and canonical in cluster_by_url:
+            clusters[cluster_by_url[canonical]].append(i)
+            continue
+
+        # LSH only returns candidates; confirm each against the cluster representative
+        minhash = _minhash(f"{item['title']} {item['content'][:500]}")
+        similarities = {
+            candidate: minhash.jaccard(representatives[candidate])
+            for candidate in lsh.query(minhash)
+        }
+        matches = [candidate for candidate, score in similarities.items() if score >= DUPLICATE_THRESHOLD]
+        if matches:
+            cluster = max(matches, key=similarities.get)
+        else:
+            cluster = len(clusters)
+            clusters.append([])
+            representatives.append(minhash)
+            lsh.insert(cluster, minhash)
+
+        if canonical:
+            cluster_by_url[canonical] = cluster
+        clusters[cluster].append(i)
+
+    return clusters
+
+# ------------------- Sentiment Cache -------------------
+
+CACHE_TTL_SECONDS = 6 * 60 * 60
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_ENTRIES = 10_000
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+def _cache_key(url, title, article_content):
+    digest = hashlib.sha256(f"{url}{title}{article_content[:2000]}".encode("utf-8")).hexdigest()
+    return f"sentiment:{digest}"
+
+async def get_cached_result(key) -> Optional[SentimentResult]:
+    try:
+        cached = await redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Could not read sentiment cache: %s", e)
+        return None
+    return SentimentResult(**orjson.loads(cached)) if cached else None
+
+async def set_cached_result(key, result: SentimentResult):
+    try:
+        await redis_client.set(key, orjson.dumps(result), ex=CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning("Could not write sentiment cache: %s", e)
+
+class SemanticCache:
+    """In-process nearest-neighbour cache of sentiment results keyed by title + description embeddings."""
+
+    def __init__(self, model_name=EMBEDDING_MODEL_NAME, threshold=SEMANTIC_SIMILARITY_THRESHOLD):
+        self.model_name = model_name
+        self.threshold = threshold
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._index = None
+        self._entries = []  # (created_at, SentimentResult), aligned with index ids
+
+    def embed(self, texts):
+        # Loaded lazily so the API starts without waiting on the model download;
+        # the lock keeps concurrent first requests from each loading their own copy
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+        vectors = self._model.encode(texts, normalize_embeddings=True)
+        return np.asarray(vectors, dtype="float32")
+
+    def search(self, vector) -> Optional[SentimentResult]:
+        if self._index is None or self._index.ntotal == 0:
+            return None
+        scores, ids = self._index.search(vector, 1)
+        if scores[0][0] < self.threshold:
+            return None
+        created_at, result = self._entries[ids[0][0]]
+        if time.time() - created_at > CACHE_TTL_SECONDS:
+            return None
+        return result
+
+    def add(self, vector, result: SentimentResult):
+        if self._index is None or self._index.ntotal >= SEMANTIC_CACHE_MAX_ENTRIES:
+            self._index = faiss.IndexFlatIP(vector.shape[1])
+            self._entries = []
+        self._index.add(vector)
+        self._entries.append((time.time(), result))
+
+semantic_cache = SemanticCache()
+
 # ------------------- Gemini Analysis -------------------
 
-def analyze_with_gemini(title, description, url, article_content):
-    prompt = f"""
+# Articles per Gemini request; the frontend caps a search at 10 articles
+GEMINI_BATCH_SIZE = 10
+# Sentiment signal sits mostly in the lede and the closing paragraphs
+CONTENT_HEAD_CHARS = 3000
+CONTENT_TAIL_CHARS = 1000
+
+SYSTEM_INSTRUCTION = """
 You are a financial news sentiment analyst.
 
-Given a news article with the following fields:
-- Title: {title}
-- Description: {description}
-- URL: {url}
-- Full Content: {article_content}
+You will receive a JSON array of news articles, each with the fields "id", "title", "description", "url" and "content_snippet".
 
-Please:
+For every article:
 1. Summarize the main points of the article in 2–3 sentences.
 2. Classify the sentiment as one of:
    - Very Bullish
@@ -97,74 +378,241 @@ Please:
    - Very Bearish
 3. Assign a confidence score from 0 to 10.
 4. Extract 2–4 bullet-point key insights that explain the sentiment choice.
-5. Return the information in this JSON format:
-
-```json
-{{
-  "title": "{title}",
-  "summary": "...",
-  "sentiment": "...",
-  "confidence": ...,
-  "insights": ["...", "..."],
-  "url": "{url}"
-}}
+5. Return one JSON object per article with the fields "id", "summary", "sentiment", "confidence" and "insights", copying the article's "id".
 """
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        contents=[{"role": "user", "parts": [{"text": prompt}]}]
-    )
 
-    response_text = response.text
+_JSON_BLOCK = re.compile(r"```json\s*(\[.*?\]|\{.*?\})\s*```", re.DOTALL)
+_JSON_OBJECT = re.compile(r"\{.*?\}", re.DOTALL)
+_ID_RE = re.compile(r'"id"\s*:\s*(\d+)')
+_SENTIMENT_RE = re.compile(r'"sentiment"\s*:\s*"([^"]+)"')
+_CONF_RE = re.compile(r'"confidence"\s*:\s*(\d+)')
+_SUMMARY_RE = re.compile(r'"summary"\s*:\s*"([^"]+)"', re.DOTALL)
+_INSIGHTS_RE = re.compile(r'"insights"\s*:\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _trim(text, n_head=CONTENT_HEAD_CHARS, n_tail=CONTENT_TAIL_CHARS):
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if len(text) <= n_head + n_tail:
+        return text
+    return text[:n_head] + "\n...\n" + text[-n_tail:]
+
+def _fallback_parse(response_text):
+    # Extract JSON-like fields using regex when the response is not valid JSON
+    article_id = _ID_RE.search(response_text)
+    sentiment = _SENTIMENT_RE.search(response_text)
+    confidence = _CONF_RE.search(response_text)
+    summary = _SUMMARY_RE.search(response_text)
+    insights_block = _INSIGHTS_RE.search(response_text)
+    insights = _QUOTED_RE.findall(insights_block.group(1)) if insights_block else []
+
+    data = {"insights": insights}
+    if article_id:
+        data["id"] = article_id.group(1)
+    if sentiment:
+        data["sentiment"] = sentiment.group(1)
+    if confidence:
+        data["confidence"] = confidence.group(1)
+    if summary:
+        data["summary"] = summary.group(1)
+    return data
 
-    # Extract JSON-like fields using regex
-    sentiment = re.search(r'"sentiment"\s*:\s*"([^"]+)"', response_text)
-    confidence = re.search(r'"confidence"\s*:\s*(\d+)', response_text)
-    summary = re.search(r'"summary"\s*:\s*"([^"]+)"', response_text, re.DOTALL)
-    insights_block = re.search(r'"insights"\s*:\s*\[(.*?)\]', response_text, re.DOTALL)
-    insights = re.findall(r'"([^"]+)"', insights_block.group(1)) if insights_block else []
+def _load_json_list(text):
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(data, dict):
+        return [data]
+    if not isinstance(data, list):
+        return None
+    # Anything other than an object can't be matched back to an article
+    return [entry for entry in data if isinstance(entry, dict)]
+
+def _parse_response(response_text):
+    # Structured output returns raw JSON; older responses wrap it in a ```json fence
+    data = _load_json_list(response_text)
+    if data is not None:
+        return data
+
+    match = _JSON_BLOCK.search(response_text)
+    if match:
+        data = _load_json_list(match.group(1))
+        if data is not None:
+            return data
+
+    return [_fallback_parse(block) for block in _JSON_OBJECT.findall(response_text)]
+
+def _to_sentiment_result(item, data):
+    try:
+        confidence = int(data.get("confidence") or 0)
+    except (TypeError, ValueError):
+        # A malformed entry is reported the same way as a missing one
+        data, confidence = {}, 0
+
+    insights = data.get("insights") or []
+    if not isinstance(insights, list):
+        insights = []
 
     return SentimentResult(
-        title=title,
-        sentiment=sentiment.group(1).strip() if sentiment else "Unknown",
-        confidence=int(confidence.group(1)) if confidence else 0,
-        summary=summary.group(1).strip() if summary else "No summary.",
-        insights=insights,
-        url=url
+        title=item["title"],
+        sentiment=str(data.get("sentiment") or "Unknown").strip(),
+        confidence=confidence,
+        summary=str(data.get("summary") or "No summary.").strip(),
+        insights=[str(insight) for insight in insights],
+        url=item["url"]
     )
 
+async def analyze_batch_with_gemini(items: List[Dict[str, str]]) -> List[SentimentResult]:
+    articles = [
+        {
+            "id": i,
+            "title": item["title"],
+            "description": item["description"],
+            "url": item["url"],
+            "content_snippet": _trim(item["content"])
+        }
+        for i, item in enumerate(items)
+    ]
+
+    async with app.state.gemini_semaphore:
+        response = await client.aio.models.generate_content(
+            model="gemini-2.0-flash",
+            contents=[{"role": "user", "parts": [{"text": orjson.dumps(articles).decode("utf-8")}]}],
+            config={
+                "system_instruction": SYSTEM_INSTRUCTION,
+                "response_mime_type": "application/json",
+                "response_schema": list[SentimentResultSchema]
+            }
+        )
+
+    # Match results back by id since the model may reorder or drop articles
+    by_id = {}
+    for data in _parse_response(response.text or ""):
+        try:
+            by_id[int(data.get("id"))] = data
+        except (TypeError, ValueError):
+            continue
+
+    return [_to_sentiment_result(item, by_id.get(i, {})) for i, item in enumerate(items)]
+
+async def _lookup_caches(items):
+    """Return a (cached result or None, cache key, embedding) triple per item."""
+    # Tier 1: exact match on the article itself
+    keys = [_cache_key(item["url"], item["title"], item["content"]) for item in items]
+    exact = await asyncio.gather(*(get_cached_result(key) for key in keys))
+    lookups = [(cached, key, None) for cached, key in zip(exact, keys)]
+
+    misses = [i for i, cached in enumerate(exact) if cached is None]
+    if not misses:
+        return lookups
+
+    # Tier 2: semantically similar article analyzed recently, all misses embedded in one call
+    embeddings = await asyncio.to_thread(
+        semantic_cache.embed,
+        [f"{items[i]['title']}\n{items[i]['description']}" for i in misses]
+    )
+    for row, i in enumerate(misses):
+        embedding = embeddings[row:row + 1]
+        cached = semantic_cache.search(embedding)
+        if cached:
+            cached = replace(cached, title=items[i]["title"], url=items[i]["url"])
+        lookups[i] = (cached, keys[i], embedding)
+
+    return lookups
+
+async def _analyze_unique_articles(items: List[Dict[str, str]]) -> AsyncIterator[Tuple[int, SentimentResult]]:
+    """Yield (index, result) pairs as soon as each cache hit or Gemini batch is available."""
+    lookups = await _lookup_caches(items)
+
+    misses = []
+    for i, (cached, _, _) in enumerate(lookups):
+        if cached:
+            yield i, cached
+        else:
+            misses.append(i)
+
+    async def run_batch(batch):
+        return batch, await analyze_batch_with_gemini([items[i] for i in batch])
+
+    batches = [misses[i:i + GEMINI_BATCH_SIZE] for i in range(0, len(misses), GEMINI_BATCH_SIZE)]
+    tasks = [asyncio.create_task(run_batch(batch)) for batch in batches]
+    try:
+        for next_batch in asyncio.as_completed(tasks):
+            batch, outcome = await next_batch
+            for i, result in zip(batch, outcome):
+                if result.sentiment != "Unknown":
+                    _, key, embedding = lookups[i]
+                    await set_cached_result(key, result)
+                    semantic_cache.add(embedding, result)
+                yield i, result
+    finally:
+        # A failed batch aborts the stream; don't leave the other batches running
+        for task in tasks:
+            task.cancel()
+
+async def analyze_articles(items: List[Dict[str, str]]) -> AsyncIterator[SentimentResult]:
+    # Syndicated copies of the same story are analyzed once and fanned back out
+    clusters = cluster_articles(items)
+    unique_items = [items[cluster[0]] for cluster in clusters]
+
+    async for index, result in _analyze_unique_articles(unique_items):
+        for i in clusters[index]:
+            yield replace(result, title=items[i]["title"], url=items[i]["url"])
+
 # ------------------- API Setup -------------------
 
-app = FastAPI(title="Sentiment Analysis API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.gemini_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GEMINI_CALLS)
+    # One article-fetch pool for the whole process: keep-alive, cached DNS and a per-host cap
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=6, ttl_dns_cache=300)
+    )
+    yield
+    await app.state.http.close()
+    await gemini_http_client.aclose()
+    log_listener.stop()
+
+app = FastAPI(title="Sentiment Analysis API", lifespan=lifespan)
+
+async def fetch_article(session, article):
+    title = article.get("title", "No Title")
+    url = article.get("url", "")
+    return {
+        "title": title,
+        "description": article.get("description", ""),
+        "url": url,
+        "content": await get_article_content(session, url, title)
+    }
+
+async def stream_results(articles):
+    try:
+        # Fetch all articles concurrently, then analyze them in batched Gemini calls
+        session = app.state.http
+        items = await asyncio.gather(*(fetch_article(session, article) for article in articles))
+
+        async for result in analyze_articles(items):
+            # orjson serializes the dataclass natively, no intermediate dict needed
+            yield orjson.dumps(result) + b"\n"
+    except Exception as e:
+        # Re-raised so the connection aborts and the client sees a failed stream, not a short one
+        logger.error("Error streaming results: %s", e)
+        raise
 
 @app.post("/analyze")
 async def analyze_sentiment(request: TopicRequest):
     try:
-        articles = get_news_articles(request.topic, request.num_articles)
+        articles = await asyncio.to_thread(get_news_articles, request.topic, request.num_articles)
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found")
-        
-        results = []
-        for article in articles:
-            title = article.get("title", "No Title")
-            description = article.get("description", "")
-            url = article.get("url", "")
-            content = get_article_content(url, title)
-            
-            result = analyze_with_gemini(title, description, url, content)
-            results.append({
-                "title": result.title,
-                "sentiment": result.sentiment,
-                "confidence": result.confidence,
-                "summary": result.summary,
-                "insights": result.insights,
-                "url": result.url
-            })
-        
-        return {"results": results}
     
     except Exception as e:
-        logging.error(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
         raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
+    
+    # Each result is sent as one NDJSON line as soon as it is ready
+    return StreamingResponse(stream_results(articles), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,10 +1,21 @@
+import html
+import math
+import orjson
+import time
+import threading
 import streamlit as st
+from collections import Counter
 import requests
-import plotly.graph_objects as go
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 
 API_URL = "http://localhost:8000/analyze"
 
+# Shared session so repeat requests reuse the pooled connection to the backend
+_SESSION = requests.Session()
+
+ANALYSIS_CACHE_TTL_SECONDS = 300
+ANALYSIS_CACHE_MAX_ENTRIES = 32
+
 st.set_page_config(
     page_title="Financial News Sentiment Analyzer",
     page_icon="📊",
@@ -39,7 +50,42 @@ def render_sidebar():
         
         return topic, num_articles, analyze_button
 
-def render_sentiment_indicator(sentiment: str, confidence: int):
+GAUGE_STEPS = [
+    (-2, -1, "red"),
+    (-1, -0.2, "lightcoral"),
+    (-0.2, 0.2, "lightgray"),
+    (0.2, 1, "lightgreen"),
+    (1, 2, "green"),
+]
+
+def _gauge_point(value: float, radius: float):
+    # -2 maps to the left end of the arc, 0 to the top and 2 to the right end
+    angle = math.radians(90 - value * 45)
+    return 100 + radius * math.cos(angle), 100 - radius * math.sin(angle)
+
+def gauge_svg(value: float) -> str:
+    arcs = []
+    for start, end, color in GAUGE_STEPS:
+        x1, y1 = _gauge_point(start, 80)
+        x2, y2 = _gauge_point(end, 80)
+        arcs.append(
+            f'<path d="M {x1:.1f} {y1:.1f} A 80 80 0 0 1 {x2:.1f} {y2:.1f}" '
+            f'fill="none" stroke="{color}" stroke-width="24"/>'
+        )
+    
+    angle = value * 45
+    # Kept unindented so Streamlit's markdown renderer does not treat it as a code block
+    return (
+        '<svg viewBox="0 0 200 125" width="100%" height="160" xmlns="http://www.w3.org/2000/svg">'
+        + "".join(arcs)
+        + f'<line x1="100" y1="100" x2="100" y2="28" stroke="darkblue" stroke-width="4" '
+        f'stroke-linecap="round" transform="rotate({angle:.1f} 100 100)"/>'
+        '<circle cx="100" cy="100" r="6" fill="darkblue"/>'
+        f'<text x="100" y="122" text-anchor="middle" font-size="16">{value:.2f}</text>'
+        '</svg>'
+    )
+
+def render_sentiment_indicator(sentiment: str, confidence: int) -> str:
     sentiment_values = {
         "Very Bearish": -2,
         "Bearish": -1,
@@ -53,33 +99,10 @@ def render_sentiment_indicator(sentiment: str, confidence: int):
     # Apply confidence as a modifier to position
     position = value * (confidence / 10)
     
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=position,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': f"{sentiment} (Confidence: {confidence}/10)"},
-        gauge={
-            'axis': {'range': [-2, 2], 'tickwidth': 1},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [-2, -1], 'color': "red"},
-                {'range': [-1, -0.2], 'color': "lightcoral"},
-                {'range': [-0.2, 0.2], 'color': "lightgray"},
-                {'range': [0.2, 1], 'color': "lightgreen"},
-                {'range': [1, 2], 'color': "green"},
-            ],
-            'threshold': {
-                'line': {'color': "black", 'width': 4},
-                'thickness': 0.75,
-                'value': position
-            }
-        }
-    ))
-    
-    fig.update_layout(height=200, margin=dict(l=10, r=10, t=50, b=10))
-    return fig
+    title = html.escape(f"{sentiment} (Confidence: {confidence}/10)")
+    return f'<div style="text-align: center"><strong>{title}</strong>{gauge_svg(position)}</div>'
 
-def render_article_card(result: Dict[str, Any], index: int = 0):
+def render_article_card(result: Dict[str, Any]):
     with st.container():
         st.subheader(result["title"])
         
@@ -96,26 +119,94 @@ def render_article_card(result: Dict[str, Any], index: int = 0):
             st.markdown(f"[Read Full Article]({result['url']})")
         
         with col2:
-            sentiment_fig = render_sentiment_indicator(
+            sentiment_gauge = render_sentiment_indicator(
                 result["sentiment"], 
                 result["confidence"]
             )
-            st.plotly_chart(sentiment_fig, use_container_width=True, key=f"chart_{index}_{result['url'][-8:]}")
+            st.markdown(sentiment_gauge, unsafe_allow_html=True)
         
         st.markdown("---")
 
-def fetch_and_analyze(topic: str, num_articles: int):
-    try:
-        with st.spinner("Analyzing news articles..."):
-            response = requests.post(
-                API_URL, 
-                json={"topic": topic, "num_articles": num_articles}
-            )
-            response.raise_for_status()
-            return response.json()["results"]
-    except requests.RequestException as e:
-        st.error(f"Error fetching results: {str(e)}")
-        return []
+def stream_analysis(topic: str, num_articles: int) -> Iterator[Dict[str, Any]]:
+    with _SESSION.post(
+        API_URL,
+        json={"topic": topic, "num_articles": num_articles},
+        timeout=60,
+        stream=True
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                yield orjson.loads(line)
+
+@st.cache_resource
+def _analysis_cache():
+    # Shared by every session, like st.cache_data; the lock guards it across script threads
+    return {}, threading.Lock()
+
+def _store_analysis(cache, key, results: List[Dict[str, Any]]):
+    now = time.time()
+    # Drop expired entries and the oldest ones beyond the cap so the cache stays bounded
+    for stale_key in [k for k, (created_at, _) in cache.items() if now - created_at >= ANALYSIS_CACHE_TTL_SECONDS]:
+        del cache[stale_key]
+    cache.pop(key, None)
+    while len(cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = (now, results)
+
+def fetch_and_analyze(topic: str, num_articles: int) -> Iterator[Dict[str, Any]]:
+    # Repeat searches within the TTL are replayed without hitting the backend
+    cache, lock = _analysis_cache()
+    key = (topic.strip().lower(), num_articles)
+    with lock:
+        cached = cache.get(key)
+    if cached and time.time() - cached[0] < ANALYSIS_CACHE_TTL_SECONDS:
+        yield from cached[1]
+        return
+
+    results = []
+    with st.spinner("Analyzing news articles..."):
+        for result in stream_analysis(topic, num_articles):
+            results.append(result)
+            yield result
+
+    # Only complete, non-empty result sets are cached; a failed stream raises before this point
+    if results:
+        with lock:
+            _store_analysis(cache, key, results)
+
+def render_summary_metrics(placeholders, results: List[Dict[str, Any]]):
+    # Calculate overall sentiment stats
+    sentiment_counts = Counter(result["sentiment"] for result in results)
+    
+    bullish_count = sentiment_counts["Very Bullish"] + sentiment_counts["Bullish"]
+    bearish_count = sentiment_counts["Very Bearish"] + sentiment_counts["Bearish"]
+    
+    total_metric, bullish_metric, bearish_metric = placeholders
+    total_metric.metric("Total Articles", len(results))
+    bullish_metric.metric("Bullish Articles", bullish_count)
+    bearish_metric.metric("Bearish Articles", bearish_count)
+
+def render_results(topic: str, results_stream: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    results = []
+    section = st.empty()
+    
+    with section.container():
+        # Display results
+        st.header(f"Analysis Results for '{topic}'")
+        
+        # Summary metrics, refreshed as each article arrives
+        placeholders = [col.empty() for col in st.columns(3)]
+        
+        # Render each article as soon as it is streamed in
+        for result in results_stream:
+            results.append(result)
+            render_summary_metrics(placeholders, results)
+            render_article_card(result)
+    
+    if not results:
+        section.info("No results found. Try a different topic.")
+    return results
 
 # ------------------- Main App -------------------
 
@@ -125,43 +216,13 @@ def main():
     
     if analyze_button or 'results' in st.session_state:
         if analyze_button:
-            results = fetch_and_analyze(topic, num_articles)
-            st.session_state.results = results
-        else:
-            results = st.session_state.results
-        
-        if results:
-            # Calculate overall sentiment stats
-            sentiment_counts = {
-                "Very Bullish": 0, 
-                "Bullish": 0,
-                "Neutral": 0,
-                "Bearish": 0,
-                "Very Bearish": 0
-            }
-            
-            for result in results:
-                if result["sentiment"] in sentiment_counts:
-                    sentiment_counts[result["sentiment"]] += 1
-            
-            # Display results
-            st.header(f"Analysis Results for '{topic}'")
-            
-            # Summary metrics
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Total Articles", len(results))
-            
-            bullish_count = sentiment_counts["Very Bullish"] + sentiment_counts["Bullish"]
-            bearish_count = sentiment_counts["Very Bearish"] + sentiment_counts["Bearish"]
-            
-            col2.metric("Bullish Articles", bullish_count)
-            col3.metric("Bearish Articles", bearish_count)
-            
-            # Render each article
-            for i, result in enumerate(results):
-                render_article_card(result, i)
+            try:
+                st.session_state.results = render_results(topic, fetch_and_analyze(topic, num_articles))
+            except requests.RequestException as e:
+                st.error(f"Error fetching results: {str(e)}")
+                st.session_state.results = []
         else:
-            st.info("No results found. Try a different topic.")
+            render_results(topic, st.session_state.results)
     else:
         st.info("Enter a topic and click 'Analyze' to get started.")
 